@@ -8,58 +8,412 @@ Usage:
 
 import argparse
 import duckdb
+import logging
+import glob
 import os
+import re
 import time
-from utils import filesystem_data_paths
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from utils import filesystem_data_paths, parallel_walk
 
 if __name__ == "__main__" and __package__ is None:
     # allow running `./scripts/reconstruct_csv.py` directly
     import sys, os
     sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-def convert_parquet_to_csv(in_file: str, out_file: str):
-    """Convert a single Parquet file to CSV with DuckDB."""
-    os.makedirs(os.path.dirname(out_file), exist_ok=True)
+# Buffered, level-gated logging: per-file prints serialize workers behind
+# stdout and issue a write syscall per line; INFO messages can be silenced
+# wholesale with --quiet for maximum throughput.
+log = logging.getLogger(__name__)
 
-    if os.path.exists(out_file):
-        print(f"⏭ Skipping {out_file} (already exists)")
+def make_connection(temp_root: str = "", threads: int = None, memory_limit: str = None):
+    """Create one tuned DuckDB connection to reuse across all conversions.
+
+    A persistent connection keeps the buffer pool and catalog warm between
+    files, and preserve_insertion_order=false lets DuckDB stream/parallelize
+    COPY without buffering whole files to keep row order (a common OOM source).
+    """
+    con = duckdb.connect()
+    con.execute(f"SET threads={threads or os.cpu_count()}")
+    con.execute("SET preserve_insertion_order=false")
+    if memory_limit:
+        con.execute(f"SET memory_limit='{memory_limit}'")
+    if temp_root:
+        con.execute(f"SET temp_directory='{os.path.join(temp_root, 'duckdb_tmp')}'")
+    return con
+
+
+# One SQL text per (columns, where) combination: paths are bound as named
+# parameters, so DuckDB reuses the prepared plan across thousands of files
+# and quotes in file paths can't break the statement. (Named rather than
+# positional: COPY binds ?-placeholders in target-first order.)
+# FORMAT CSV is explicit: with a bound target DuckDB can't sniff the extension.
+# OVERWRITE_OR_IGNORE makes the write idempotent inside the engine, so no
+# Python-side existence check (one stat per file, and racy between workers)
+# is needed.
+COPY_SQL = ("COPY (SELECT {select_list} FROM read_parquet($in_file){where_clause})"
+            " TO $out_file (FORMAT CSV, HEADER, DELIMITER ',', OVERWRITE_OR_IGNORE{compression_clause})")
+
+# Writing uncompressed CSV to the cold HDD is bandwidth-bound: fewer bytes
+# written means proportionally less wall time, regardless of CPU.
+CSV_EXT = {"none": ".csv", "gzip": ".csv.gz", "zstd": ".csv.zst"}
+
+
+def compression_clause(compression: str = None) -> str:
+    """COPY option fragment for the chosen CSV compression ("" when none)."""
+    if not compression or compression == "none":
+        return ""
+    return f", COMPRESSION '{compression}'"
+
+
+def build_select_list(columns: list = None) -> str:
+    """Quoted SELECT list for the COPY inner query ("*" when no projection)."""
+    if not columns:
+        return "*"
+    return ", ".join('"' + c.strip().replace('"', '""') + '"' for c in columns)
+
+
+def fadvise(path: str, advice: int):
+    """Pass a posix_fadvise hint for the whole file (no-op where unsupported).
+
+    SEQUENTIAL on the NVMe input tells the kernel to read ahead aggressively;
+    DONTNEED on the just-written HDD output evicts those pages immediately so
+    the slow cold-tier write-back doesn't push useful hot-tier pages out of
+    the page cache. (Windows has no fadvise; sequential hints there would need
+    FILE_FLAG_SEQUENTIAL_SCAN on the handle, which DuckDB owns.)
+    """
+    if not hasattr(os, "posix_fadvise"):
         return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, advice)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # advisory only — never fail the conversion over a hint
+
 
-    print(f"🔄 Converting {in_file} → {out_file}")
+def convert_parquet_to_csv(con, in_file: str, out_file: str,
+                           columns: list = None, where: str = None,
+                           compression: str = None):
+    """Convert a single Parquet file to CSV with DuckDB.
+
+    The output directory must already exist — process_all_parquet creates the
+    whole tree in one upfront batch rather than one mkdir/stat pair per file.
+    Already-present outputs are skipped by COPY's OVERWRITE_OR_IGNORE; the
+    bulk skip happens via the pre-listed set in process_all_parquet.
+    """
+    log.info(f"🔄 Converting {in_file} → {out_file}")
     start = time.time()
 
+    if hasattr(os, "POSIX_FADV_SEQUENTIAL"):
+        fadvise(in_file, os.POSIX_FADV_SEQUENTIAL)
+
     try:
-        duckdb.sql(f"""
-            COPY (SELECT * FROM read_parquet('{in_file}'))
-            TO '{out_file}'
-            WITH (HEADER, DELIMITER ',');
-        """)
+        sql = COPY_SQL.format(select_list=build_select_list(columns),
+                              where_clause=f" WHERE {where}" if where else "",
+                              compression_clause=compression_clause(compression))
+        con.execute(sql, {"in_file": in_file, "out_file": out_file})
         elapsed = time.time() - start
-        print(f"✅ Done in {elapsed:.2f} sec")
+        if hasattr(os, "POSIX_FADV_DONTNEED"):
+            fadvise(out_file, os.POSIX_FADV_DONTNEED)
+        log.info(f"✅ Done in {elapsed:.2f} sec")
     except Exception as e:
-        print(f"❌ Failed {in_file}: {e}")
+        log.warning(f"❌ Failed {in_file}: {e}")
+
+
+def parquet_glob(input_root: str, year: str = None, month: str = None) -> str:
+    """Build a recursive glob for the year/month filters (e.g. **/*2020*-02*.parquet).
+
+    Both the filesystem (glob.iglob) and DuckDB's Parquet scanner can prune
+    non-matching files directly from this pattern, instead of visiting every
+    file and substring-matching its name in Python.
+    """
+    month_part = f"-{int(month):02d}" if month else ""
+    return os.path.join(input_root, "**", f"*{year or ''}*{month_part}*.parquet")
+
+
+def parquet_name_pattern(year: str = None, month: str = None):
+    """Compile the year/month filename filter into one re.Pattern.
+
+    One compiled match per filename replaces the per-file substring checks
+    and month re-formatting — micro, but the walk can see millions of names
+    on cold tiers.
+    """
+    if not (year or month):
+        return re.compile(r".*\.parquet$")
+    year_part = re.escape(year) if year else ""
+    month_part = f"-{int(month):02d}" if month else ""
+    return re.compile(rf".*{year_part}.*{month_part}.*\.parquet$")
+
+
+def convert_parquet_batch(con, source, input_root: str, output_root: str,
+                          columns: list = None, where: str = None,
+                          compression: str = None):
+    """Convert all Parquet files in a single DuckDB COPY, then mirror the source layout.
+
+    One query lets DuckDB's vectorized engine and multi-threaded Parquet scanner
+    drive every file at once, instead of paying planner/startup cost per file.
+    `source` is either a list of paths or a glob pattern that DuckDB expands
+    itself. DuckDB writes one partition directory per source file
+    (filename=<url-encoded path>/data_0.csv), which we rename afterwards to
+    mirror the input hierarchy.
+    """
+    if isinstance(source, str):
+        files_sql = "'" + source.replace("'", "''") + "'"
+        log.info(f"🔄 Converting {files_sql} → {output_root} (single DuckDB query)")
+    else:
+        files_sql = "[" + ", ".join("'" + f.replace("'", "''") + "'" for f in source) + "]"
+        log.info(f"🔄 Converting {len(source)} Parquet files → {output_root} (single DuckDB query)")
+    start = time.time()
+
+    # Projection pushdown: decoding only the requested columns skips the
+    # (often dominant) Parquet string-decode cost; a WHERE clause lets the
+    # scanner drop whole row groups via their zone maps.
+    select_list = build_select_list(columns)
+    if select_list != "*":
+        select_list += ", filename"  # partition key must stay in the projection
+
+    con.execute(f"""
+        COPY (SELECT {select_list} FROM read_parquet({files_sql}, filename=true, union_by_name=true)
+              {f"WHERE {where}" if where else ""})
+        TO '{output_root}'
+        (FORMAT CSV, HEADER, PARTITION_BY (filename), OVERWRITE_OR_IGNORE{compression_clause(compression)});
+    """)
+
+    # Rename the hive-style partition dirs back into the original tree shape
+    for entry in os.listdir(output_root):
+        if not entry.startswith("filename="):
+            continue
+        part_dir = os.path.join(output_root, entry)
+        src_path = urllib.parse.unquote(entry.split("=", 1)[1])
+        rel_path = os.path.relpath(src_path, input_root)
+        ext = CSV_EXT.get(compression or "none", ".csv")
+        out_file = os.path.join(output_root, rel_path).replace(".parquet", ext)
+
+        os.makedirs(os.path.dirname(out_file), exist_ok=True)
+        os.replace(os.path.join(part_dir, "data_0" + ext), out_file)
+        os.rmdir(part_dir)
+
+    elapsed = time.time() - start
+    log.info(f"✅ Done in {elapsed:.2f} sec")
+
+
+def convert_parquet_sharded(con, source, output_root: str,
+                            columns: list = None, where: str = None,
+                            compression: str = None):
+    """One COPY, DuckDB's own parallel writer, hive-partitioned output kept as-is.
+
+    Partitioning by the extracted source basename keeps all cores busy inside
+    a single query (preserve_insertion_order=false unlocks the parallel
+    writer) and skips the Python-side rename pass entirely: output lands as
+    <out>/src=<original name>/data_0.csv. PER_THREAD_OUTPUT cannot be
+    combined with PARTITION_BY, so partitioning does the sharding.
+    """
+    if isinstance(source, str):
+        files_sql = "'" + source.replace("'", "''") + "'"
+        n_desc = files_sql
+    else:
+        files_sql = "[" + ", ".join("'" + f.replace("'", "''") + "'" for f in source) + "]"
+        n_desc = f"{len(source)} Parquet files"
+
+    select_list = build_select_list(columns)
+    if select_list == "*":
+        select_list = "* EXCLUDE (filename)"
+
+    log.info(f"🔄 Converting {n_desc} → {output_root} (sharded single DuckDB query)")
+    start = time.time()
 
+    con.execute(f"""
+        COPY (SELECT {select_list},
+                     regexp_extract(filename, '([^/\\\\]+)[.]parquet$', 1) AS src
+              FROM read_parquet({files_sql}, filename=true, union_by_name=true)
+              {f"WHERE {where}" if where else ""})
+        TO '{output_root}'
+        (FORMAT CSV, HEADER, PARTITION_BY (src), OVERWRITE_OR_IGNORE{compression_clause(compression)});
+    """)
 
-def process_all_parquet(input_root: str, output_root: str, year: str = None, month: str = None):
+    log.info(f"✅ Done in {time.time() - start:.2f} sec")
+
+
+_YEAR_RE = re.compile(r"(\d{4})")
+
+
+def convert_parquet_coalesced(con, in_files: list, input_root: str, output_root: str,
+                              columns: list = None, where: str = None,
+                              compression: str = None):
+    """Fuse many small Parquet inputs into one CSV per (dataset, year) bucket.
+
+    With many small monthly files, per-file open/footer-scan overhead
+    dominates. Grouping by top-level dataset dir and the year in the filename
+    lets one COPY per bucket open all its files with DuckDB's parallel
+    scanner (UNION BY NAME absorbs schema drift between months) and write a
+    single coalesced CSV.
+    """
+    groups = {}
+    for in_file in in_files:
+        rel_path = os.path.relpath(in_file, input_root)
+        dataset = rel_path.split(os.sep)[0] if os.sep in rel_path else "all"
+        m = _YEAR_RE.search(os.path.basename(in_file))
+        year = m.group(1) if m else "unknown"
+        groups.setdefault((dataset, year), []).append(in_file)
+
+    ext = CSV_EXT.get(compression or "none", ".csv")
+    select_list = build_select_list(columns)
+
+    for (dataset, year), files in sorted(groups.items()):
+        out_file = os.path.join(output_root, f"{dataset}_{year}{ext}")
+        files_sql = "[" + ", ".join("'" + f.replace("'", "''") + "'" for f in files) + "]"
+
+        log.info(f"🔄 Coalescing {len(files)} files → {out_file}")
+        start = time.time()
+        con.execute(f"""
+            COPY (SELECT {select_list} FROM read_parquet({files_sql}, union_by_name=true)
+                  {f"WHERE {where}" if where else ""})
+            TO '{out_file}'
+            (FORMAT CSV, HEADER{compression_clause(compression)});
+        """)
+        log.info(f"✅ Done in {time.time() - start:.2f} sec")
+
+
+def convert_via_stage_db(stage_db: str, source, input_root: str, output_root: str,
+                         columns: list = None, where: str = None):
+    """Ingest the Parquet tree into a persistent DuckDB table once, then emit CSVs.
+
+    Recurring reconstruction runs re-pay the Parquet decode cost every time.
+    Staging into a .duckdb file amortizes that decode across runs: the first
+    invocation materializes the data, later ones skip straight to the COPY
+    from DuckDB's native format (which also scans/parallelizes faster).
+    """
+    con = duckdb.connect(stage_db)
+    con.execute("SET preserve_insertion_order=false")
+
+    if isinstance(source, str):
+        files_sql = "'" + source.replace("'", "''") + "'"
+    else:
+        files_sql = "[" + ", ".join("'" + f.replace("'", "''") + "'" for f in source) + "]"
+
+    log.info(f"🔄 Staging Parquet files into {stage_db} (skipped if already staged)")
+    con.execute(f"""
+        CREATE TABLE IF NOT EXISTS staged AS
+        SELECT * FROM read_parquet({files_sql}, filename=true, union_by_name=true);
+    """)
+
+    select_list = build_select_list(columns)
+    if select_list == "*":
+        select_list = "* EXCLUDE (filename)"
+    where_clause = f" AND ({where})" if where else ""
+
+    for (src_file,) in con.execute("SELECT DISTINCT filename FROM staged").fetchall():
+        rel_path = os.path.relpath(src_file, input_root)
+        out_file = os.path.join(output_root, rel_path).replace(".parquet", ".csv")
+        os.makedirs(os.path.dirname(out_file), exist_ok=True)
+
+        log.info(f"🔄 Emitting {src_file} → {out_file}")
+        start = time.time()
+        con.execute(f"""
+            COPY (SELECT {select_list} FROM staged WHERE filename=$src{where_clause})
+            TO $out_file (FORMAT CSV, HEADER, DELIMITER ',');
+        """, {"src": src_file, "out_file": out_file})
+        log.info(f"✅ Done in {time.time() - start:.2f} sec")
+
+
+def convert_per_file(con, pairs: list, max_workers: int = None,
+                     columns: list = None, where: str = None,
+                     compression: str = None):
+    """Convert (in_file, out_file) pairs in parallel, one DuckDB cursor per worker.
+
+    DuckDB's COPY releases the GIL in native code and the work is I/O-bound
+    (NVMe read → HDD write), so a thread pool overlaps files up to the slower
+    tier's bandwidth. Cursors from one connection are thread-safe siblings.
+    """
+    max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        list(ex.map(lambda p: convert_parquet_to_csv(con.cursor(), *p,
+                                                     columns=columns, where=where,
+                                                     compression=compression), pairs))
+
+
+def process_all_parquet(con, input_root: str, output_root: str, year: str = None, month: str = None,
+                        max_workers: int = None, columns: list = None, where: str = None,
+                        stage_db: str = None, compression: str = None,
+                        sharded: bool = False, coalesce: bool = False):
     """Walk input_root, convert Parquet → CSV into mirrored structure under output_root."""
-    for dirpath, _, filenames in os.walk(input_root):
-        for fname in filenames:
-            if not fname.endswith(".parquet"):
-                continue
+    name_pat = parquet_name_pattern(year, month)
+
+    if year or month:
+        # Push the filters down as a glob: the filesystem prunes non-matching
+        # files during expansion, and DuckDB's scanner prunes them again when
+        # given the pattern directly (no per-file footer reads).
+        batch_source = parquet_glob(input_root, year, month)
+        in_files = list(glob.iglob(batch_source, recursive=True))
+    else:
+        in_files = []
+        for dirpath, _, filenames in parallel_walk(input_root):
+            for fname in filenames:
+                if name_pat.match(fname):
+                    in_files.append(os.path.join(dirpath, fname))
+        batch_source = in_files
+
+    # One enumeration of the output tree instead of a stat syscall per file:
+    # membership in this set is the skip test from here on.
+    ext = CSV_EXT.get(compression or "none", ".csv")
+    existing = {os.path.join(dp, f)
+                for dp, _, fs in os.walk(output_root)
+                for f in fs if f.endswith(ext)}
+    if existing:
+        remaining = []
+        for in_file in in_files:
+            rel_path = os.path.relpath(in_file, input_root)
+            out_file = os.path.join(output_root, rel_path).replace(".parquet", ext)
+            if out_file in existing:
+                log.info(f"⏭ Skipping {out_file} (already exists)")
+            else:
+                remaining.append(in_file)
+        in_files = remaining
+        batch_source = in_files  # filtered explicit list beats the raw glob here
+
+    if not in_files:
+        log.info(f"⏭ No Parquet files to convert under {input_root}")
+        return
 
-            # Year/month filters (if provided)
-            if year and year not in fname:
-                continue
-            if month and f"-{int(month):02d}" not in fname:
-                continue
+    if coalesce:
+        os.makedirs(output_root, exist_ok=True)
+        convert_parquet_coalesced(con, in_files, input_root, output_root,
+                                  columns=columns, where=where, compression=compression)
+        return
 
-            rel_path = os.path.relpath(dirpath, input_root)
-            in_file = os.path.join(dirpath, fname)
+    if sharded:
+        convert_parquet_sharded(con, batch_source, output_root,
+                                columns=columns, where=where, compression=compression)
+        return
 
-            out_dir = os.path.join(output_root, rel_path)
-            out_file = os.path.join(out_dir, fname.replace(".parquet", ".csv"))
+    if stage_db:
+        convert_via_stage_db(stage_db, batch_source, input_root, output_root,
+                             columns=columns, where=where)
+        return
 
-            convert_parquet_to_csv(in_file, out_file)
+    pairs = []
+    for in_file in in_files:
+        rel_path = os.path.relpath(in_file, input_root)
+        out_file = os.path.join(output_root, rel_path).replace(".parquet", ext)
+        pairs.append((in_file, out_file))
+
+    # Create the distinct output dirs in one batch: per-file makedirs issues
+    # mkdir/stat syscalls even when the dir was created a moment earlier.
+    for out_dir in sorted({os.path.dirname(o) for _, o in pairs}):
+        os.makedirs(out_dir, exist_ok=True)
+
+    try:
+        convert_parquet_batch(con, batch_source, input_root, output_root,
+                              columns=columns, where=where, compression=compression)
+    except Exception as e:
+        log.warning(f"❌ Batch conversion failed ({e}); falling back to per-file conversion")
+        convert_per_file(con, pairs, max_workers=max_workers, columns=columns, where=where,
+                         compression=compression)
 
 
 def main():
@@ -69,18 +423,43 @@ def main():
     parser.add_argument("--dataset", default="nyc_tlc", help="Dataset name (default: nyc_tlc)")
     parser.add_argument("--year", help="Optional year filter (e.g. 2020)")
     parser.add_argument("--month", help="Optional month filter (1–12)")
+    parser.add_argument("--columns", help="Comma-separated columns to keep (default: all)")
+    parser.add_argument("--where", help="Optional SQL predicate pushed into the Parquet scan")
+    parser.add_argument("--threads", type=int, help="DuckDB threads (default: all cores)")
+    parser.add_argument("--max-workers", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="Worker threads for per-file conversion (default: half the cores)")
+    parser.add_argument("--memory-limit", help="DuckDB memory limit (e.g. 8GB)")
+    parser.add_argument("--stage-db", help="Persistent .duckdb file: ingest Parquet once, emit CSVs from it")
+    parser.add_argument("--coalesce", action="store_true",
+                        help="Fuse inputs into one CSV per (dataset, year) bucket")
+    parser.add_argument("--sharded", action="store_true",
+                        help="Keep DuckDB's hive-partitioned layout (src=<name>/data_0.csv), skipping renames")
+    parser.add_argument("--compression", choices=["none", "gzip", "zstd"], default="none",
+                        help="Compress CSV output (zstd cuts cold-HDD write bytes 3-5x)")
+    parser.add_argument("--quiet", action="store_true", help="Silence per-file progress logs")
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        format="%(asctime)s %(message)s")
+
     # Resolve tiered paths
     paths = filesystem_data_paths(args.dataset)
     input_root = os.path.join(paths["hot"], args.input)   # e.g. /hotdata/nyc_tlc/parquet
     output_root = os.path.join(paths["cold"], args.output)  # e.g. /colddata/nyc_tlc/csv
 
-    print(f"📂 Input root: {input_root}")
-    print(f"📂 Output root: {output_root}")
+    log.info(f"📂 Input root: {input_root}")
+    log.info(f"📂 Output root: {output_root}")
+
+    # One connection for the whole run; spill to the cold tier if memory runs out
+    con = make_connection(paths["cold"], threads=args.threads, memory_limit=args.memory_limit)
 
-    process_all_parquet(input_root, output_root, year=args.year, month=args.month)
+    process_all_parquet(con, input_root, output_root, year=args.year, month=args.month,
+                        max_workers=args.max_workers,
+                        columns=args.columns.split(",") if args.columns else None,
+                        where=args.where, stage_db=args.stage_db,
+                        compression=args.compression, sharded=args.sharded,
+                        coalesce=args.coalesce)
 
 
 if __name__ == "__main__":
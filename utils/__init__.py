@@ -1 +1 @@
-from .filesystem import filesystem_data_paths
+from .filesystem import filesystem_data_paths, parallel_walk
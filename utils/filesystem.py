@@ -7,10 +7,20 @@ and optionally warm (external SSD) storage.
 Works on Windows and Linux (Ubuntu).
 """
 
+import functools
 import platform
 import os
+import queue
+import threading
 
+# The platform can't change during process lifetime — resolve it once
+_IS_WINDOWS = platform.system() == "Windows"
 
+# Tier paths already created/verified this process — check each only once
+_ensured: set = set()
+
+
+@functools.lru_cache(maxsize=None)
 def filesystem_data_paths(dataset: str = "") -> dict:
     """
     Return OS-specific base paths for hotdata and colddata.
@@ -28,7 +38,7 @@ def filesystem_data_paths(dataset: str = "") -> dict:
     """
     tiers = ["hot", "cold"]  # future: add "warm"
 
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         roots = {"hot": "D:/", "cold": "E:/"}  # e.g. add "warm": "F:/"
     else:
         roots = {x: f"/{x}data" for x in tiers}  # /hotdata, /colddata
@@ -38,14 +48,78 @@ def filesystem_data_paths(dataset: str = "") -> dict:
         base = roots[tier]
         path = os.path.join(base, dataset) if dataset else base
 
-        try:
-            os.makedirs(path, exist_ok=True)
-        except PermissionError:
-            print(f"⚠️ Warning: Could not create/access {path} (check permissions or mount).")
+        if path not in _ensured:
+            try:
+                os.makedirs(path, exist_ok=True)
+            except PermissionError:
+                print(f"⚠️ Warning: Could not create/access {path} (check permissions or mount).")
 
-        if not os.path.exists(path):
-            print(f"⚠️ Warning: {tier.upper()} storage path not available: {path}")
+            if not os.path.exists(path):
+                print(f"⚠️ Warning: {tier.upper()} storage path not available: {path}")
+
+            _ensured.add(path)
 
         paths[tier] = path
 
     return paths
+
+
+def parallel_walk(top: str, num_workers: int = 8):
+    """
+    Multithreaded drop-in for os.walk, yielding (dirpath, dirnames, filenames).
+
+    os.walk issues one readdir at a time; on cold-tier HDDs or network mounts
+    the traversal itself can dominate wall time. Here a pool of worker threads
+    pulls directories off a LIFO queue and scans them with os.scandir, so
+    enumeration overlaps across subtrees (and with any downstream consumer).
+
+    Ordering is not deterministic. Keep num_workers low on spinning disks
+    (seek-bound); raise it on NVMe or network filesystems.
+    """
+    dirs = queue.LifoQueue()
+    dirs.put(top)
+    results = queue.Queue()
+    lock = threading.Lock()
+    outstanding = [1]  # directories queued but not yet scanned
+
+    def worker():
+        while True:
+            dirpath = dirs.get()
+            if dirpath is None:
+                break
+
+            dirnames, filenames = [], []
+            try:
+                with os.scandir(dirpath) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirnames.append(entry.name)
+                        else:
+                            filenames.append(entry.name)
+            except OSError as e:
+                print(f"⚠️ Warning: Could not scan {dirpath}: {e}")
+
+            with lock:
+                outstanding[0] += len(dirnames)
+            for d in dirnames:
+                dirs.put(os.path.join(dirpath, d))
+
+            results.put((dirpath, dirnames, filenames))
+            with lock:
+                outstanding[0] -= 1
+                if outstanding[0] == 0:
+                    results.put(None)  # sentinel: traversal complete
+
+    workers = [threading.Thread(target=worker, daemon=True) for _ in range(num_workers)]
+    for w in workers:
+        w.start()
+
+    try:
+        while True:
+            item = results.get()
+            if item is None:
+                break
+            yield item
+    finally:
+        for _ in workers:
+            dirs.put(None)
@@ -4,10 +4,17 @@ System Diagnostics Utilities
 Provides version info on the Python instances used.
 """
 
+import functools
 import importlib
 import os
 import sys
+from importlib.metadata import version, PackageNotFoundError
 
+# Deliberately NOT re-exported from utils/__init__.py: production CLIs import
+# utils for the filesystem helpers and shouldn't pay for diagnostics. Use an
+# explicit `from utils.pystackinfo import pystack_summary` where needed.
+
+@functools.lru_cache(maxsize=None)
 def get_pystack_diagnostics(requirements_file="requirements-dev.txt") -> dict:
     """Collect system diagnostics into a dictionary."""
 
@@ -29,6 +36,15 @@ def get_pystack_diagnostics(requirements_file="requirements-dev.txt") -> dict:
                 omit_info = "-omit-info" in line
                 pkg_name = line.split()[0]
                 if not omit_info:
+                    # Read the installed distribution's METADATA file directly —
+                    # importing the package just for __version__ can execute
+                    # thousands of lines and allocate MBs (pandas, duckdb, ...).
+                    try:
+                        diagnostics["DevStack"][pkg_name] = version(pkg_name)
+                        continue
+                    except PackageNotFoundError:
+                        pass  # fall back to importing under the override name
+
                     try:
                         import_pkg_name = pkg_name
                         if "import-name" in line: # split on "import-name" and take the remainder
@@ -37,8 +53,8 @@ def get_pystack_diagnostics(requirements_file="requirements-dev.txt") -> dict:
                             except IndexError:
                                 pass  # fallback to pkg_name if malformed
                         module = importlib.import_module(import_pkg_name)
-                        version = getattr(module, "__version__", "N/A") # Version not available
-                        diagnostics["DevStack"][pkg_name] = version
+                        pkg_version = getattr(module, "__version__", "N/A") # Version not available
+                        diagnostics["DevStack"][pkg_name] = pkg_version
                     except ImportError:
                         diagnostics["DevStack"][pkg_name] = "not_installed" # Not Installed
                         pass
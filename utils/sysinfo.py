@@ -6,23 +6,230 @@ Works on Windows, Linux (Ubuntu), and macOS.
 """
 
 import ast
+import atexit
 import json
 import math
+import os
 import platform
+import plistlib
 import psutil
 import re
 import requests
 import shutil
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import pystackinfo
 
+# Core/thread counts can't change while the process runs; resolve them once at
+# import instead of re-opening /proc per call. cpu_freq() stays a live call —
+# its "current" field is the one dynamic value the dashboard wants fresh.
+_LOGICAL = psutil.cpu_count(logical=True)
+_PHYSICAL = psutil.cpu_count(logical=False)
+
+# Prime the per-CPU counters so the first snapshot_dashboard call returns a
+# real diff instead of zeros (cpu_percent with no interval measures since the
+# previous call). Costs microseconds at import.
+psutil.cpu_percent(percpu=True)
+
+# The OS can't change either. Each getter's concrete implementation is chosen
+# once at import from this constant (see the _*_impl bindings below), so calls
+# never re-branch on platform.system().
+_SYSTEM = platform.system()
+
+# Prefer pynvml (in-process ctypes calls into libnvidia-ml) over GPUtil, which
+# shells out to nvidia-smi (~100-300 ms) on every getGPUs() call.
 checkGPU = False
+checkNVML = False
 try:
-    import GPUtil
+    import pynvml
+    pynvml.nvmlInit()
+    atexit.register(pynvml.nvmlShutdown)
+    checkNVML = True
     checkGPU = True
+except Exception:
+    try:
+        import GPUtil
+        checkGPU = True
+    except ImportError:
+        checkGPU = False
+
+checkWMI = False
+try:
+    import wmi  # in-process CIM access on Windows, no PowerShell spawn
+    checkWMI = True
 except ImportError:
-    checkGPU = False
+    checkWMI = False
+
+try:
+    from orjson import loads as _jloads  # 2-4x faster C parser when available
+except ImportError:
+    from json import loads as _jloads
+
+# ------------------------------
+# Windows: batched CIM query
+# ------------------------------
+
+_WIN_SYSINFO = None
+_WIN_SYSINFO_LOCK = threading.Lock()
+
+def _win_sysinfo_once() -> dict:
+    """Fetch all static Windows CIM data in a single PowerShell invocation.
+
+    Each powershell.exe spawn pays hundreds of ms of interpreter startup, and
+    the getters used to spawn up to five of them. One -NoProfile call returns
+    every Win32_* class we need as a single JSON blob, cached for the life of
+    the process (the answers are burned into firmware/registry anyway).
+
+    get_system_diagnostics fans the getters out over a thread pool, so the
+    first calls race here; the lock makes the losers wait for the winner's
+    blob instead of each spawning their own duplicate query.
+    """
+    global _WIN_SYSINFO
+    if _WIN_SYSINFO is not None:
+        return _WIN_SYSINFO
+
+    with _WIN_SYSINFO_LOCK:
+        if _WIN_SYSINFO is not None:  # another getter won the race
+            return _WIN_SYSINFO
+
+        if checkWMI:
+            # Preferred: talk to the same CIM providers in-process via the wmi
+            # package (~ms instead of the PowerShell+CLR bootstrap's ~500ms).
+            try:
+                # The diagnostics thread pool calls us from worker threads,
+                # which are not COM-initialized — wmi.WMI() raises
+                # CO_E_NOTINITIALIZED there without an explicit CoInitialize.
+                import pythoncom
+                pythoncom.CoInitialize()
+                try:
+                    c = wmi.WMI()
+                    csp = c.Win32_ComputerSystemProduct()[0]
+                    _WIN_SYSINFO = {
+                        "CSP": {"Vendor": csp.Vendor, "Version": csp.Version, "Name": csp.Name},
+                        "CPU": [
+                            {
+                                "Name": p.Name,
+                                "NumberOfCores": p.NumberOfCores,
+                                "NumberOfLogicalProcessors": p.NumberOfLogicalProcessors,
+                                "MaxClockSpeed": p.MaxClockSpeed,
+                            }
+                            for p in c.Win32_Processor()
+                        ],
+                        "MEM": [
+                            {
+                                "Capacity": int(m.Capacity or 0),
+                                "Speed": m.Speed,
+                                "SMBIOSMemoryType": m.SMBIOSMemoryType,
+                            }
+                            for m in c.Win32_PhysicalMemory()
+                        ],
+                        "OS": c.Win32_OperatingSystem()[0].Caption,
+                    }
+                    try:
+                        storage = wmi.WMI(namespace=r"root\Microsoft\Windows\Storage")
+                        _WIN_SYSINFO["DISK"] = [
+                            {
+                                "FriendlyName": d.FriendlyName,
+                                "Manufacturer": getattr(d, "Manufacturer", None),
+                                "SerialNumber": getattr(d, "SerialNumber", None),
+                                "Size": int(d.Size or 0),
+                                "BusType": d.BusType,
+                                "MediaType": d.MediaType,
+                            }
+                            for d in storage.MSFT_PhysicalDisk()
+                        ]
+                    except Exception:
+                        pass  # storage falls back to its own PowerShell query
+                finally:
+                    pythoncom.CoUninitialize()
+            except Exception:
+                _WIN_SYSINFO = None  # fall through to the PowerShell path
+
+        if _WIN_SYSINFO is None:
+            script = (
+                "@{"
+                "CSP=Get-CimInstance Win32_ComputerSystemProduct | Select-Object Vendor,Version,Name;"
+                "CPU=Get-CimInstance Win32_Processor | Select-Object Name,NumberOfCores,NumberOfLogicalProcessors,MaxClockSpeed;"
+                "MEM=Get-CimInstance Win32_PhysicalMemory | Select-Object Capacity,Speed,SMBIOSMemoryType;"
+                "DISK=Get-PhysicalDisk | Select-Object FriendlyName,Manufacturer,SerialNumber,Size,BusType,MediaType;"
+                "OS=(Get-CimInstance Win32_OperatingSystem).Caption"
+                "} | ConvertTo-Json -Depth 4"
+            )
+            try:
+                output = subprocess.check_output(
+                    ["powershell", "-NoProfile", "-NonInteractive", "-Command", script],
+                    text=True
+                )
+                _WIN_SYSINFO = json.loads(output)
+            except Exception:
+                _WIN_SYSINFO = {}
+        return _WIN_SYSINFO
+
+def _as_list(obj):
+    """ConvertTo-Json collapses single-element arrays to one object; undo that."""
+    if obj is None:
+        return []
+    return obj if isinstance(obj, list) else [obj]
+
+def _strip(value):
+    """str.strip, passed through unchanged for non-strings (lsblk emits nulls/ints)."""
+    return value.strip() if isinstance(value, str) else value
+
+def _sysfs(path: str, default: str = "") -> str:
+    """Read a tiny /sys (or DMI) attribute with one raw read.
+
+    These files are all <32 bytes of ASCII, so a bare os.open/os.read skips
+    the buffered-IO and codec setup of a text-mode open(). Values are cached:
+    sysfs attributes we consult (vendor, model, rotational, removable) don't
+    change while the process runs.
+    """
+    cached = _sysfs_cache.get(path)
+    if cached is not None:
+        return cached
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            value = os.read(fd, 64).decode().strip()
+        finally:
+            os.close(fd)
+    except OSError:
+        value = default
+    _sysfs_cache[path] = value
+    return value
+
+_sysfs_cache: dict = {}
+
+def _clean_vendor(vendor: str) -> str:
+    """Strip corporate suffixes and trailing punctuation from a vendor name."""
+    return _VENDOR_NOISE.sub("", vendor.strip())
+
+# ------------------------------
+# Compiled regex patterns
+# ------------------------------
+# Hoisted to module scope: re's internal cache still pays a dict lookup (and
+# occasional re-parse) per call, which adds up when system_summary runs in a
+# dashboard refresh loop.
+
+# Trailing punctuation, corporate suffixes (Inc./Ltd./Corp/Co.), and whatever
+# punctuation those leave behind, all scrubbed in one repeated-group pass.
+_VENDOR_NOISE = re.compile(r"(?:\b(?:inc\.?|ltd\.?|corp|co\.?)\b|[.,\s]+)+$", re.IGNORECASE)
+_CPU_STRIP = re.compile(r"\(R\)|\(TM\)|CPU|@.*GHz", re.IGNORECASE)
+_WS = re.compile(r"\s+")
+_INTEL_CORE = re.compile(r"(i3|i5|i7|i9)-(\d{3,5})")
+_DDR_CPU_HINT = re.compile(
+    r"(Core|Xeon|Pentium\s4|Celeron\sD|Athlon\s64|Opteron|Turion|Phenom|i[3579]|Ryzen)",
+    re.IGNORECASE,
+)
+_SIZE_GB = re.compile(r"Size:\s+(\d+)\s+GB")
+_MEM_TYPE = re.compile(r"Type:\s*([A-Za-z0-9]+)", re.IGNORECASE)
+_SPEED_MAX = re.compile(r"Maximum Speed:\s+(\d+)\s+MHz")
+_SPEED_CFG = re.compile(r"Speed:\s+(\d+)\s+MHz")
+_BANK = re.compile(r"BANK \d+/DIMM\d+:")
+_PROC_MODEL_NAME = re.compile(r"^model name\s*:\s*(.+)$", re.MULTILINE)
 
 # ------------------------------
 # System Model
@@ -82,125 +289,80 @@ def merge_model_names(names):
 
 
 
-def get_system_model():
-    """Return system model string for Windows/Linux/macOS."""
-    try:
-        system = platform.system()
-
-        if system == "Windows":
-            version = subprocess.check_output(
-                [
-                    "powershell", "-Command",
-                    "Get-CimInstance -ClassName Win32_ComputerSystemProduct | "
-                    "Select-Object Version | Format-Table -HideTableHeaders"
-                ],
-                text=True
-            ).strip()
-
-            vendor = subprocess.check_output(
-                [
-                    "powershell", "-Command",
-                    "Get-CimInstance -ClassName Win32_ComputerSystemProduct | "
-                    "Select-Object Vendor | Format-Table -HideTableHeaders"
-                ],
-                text=True
-            ).strip()
-
-            # Remove trailing punctuation (.,)
-            vendor = re.sub(r"[.,\s]+$", "", vendor)
-
-            # Remove common company suffixes
-            vendor = re.sub(r"\b(inc|inc\.|ltd|ltd\.|corp|co\.?)\b$", "", vendor, flags=re.IGNORECASE)
-
-            # Remove any leftover trailing punctuation/whitespace again
-            vendor = re.sub(r"[.,\s]+$", "", vendor)
-
-            if version == '':
-                queryStr = "Select-Object Name | Format-Table -HideTableHeaders"
-            else:
-                queryStr = "Select-Object Version | Format-Table -HideTableHeaders"
+def _get_system_model_win():
+    csp = _as_list(_win_sysinfo_once().get("CSP"))
+    csp = csp[0] if csp else {}
+    version = (csp.get("Version") or "").strip()
+    vendor = _clean_vendor(csp.get("Vendor") or "")
 
-            out = subprocess.check_output(
-                [
-                    "powershell", "-Command",
-                    "Get-CimInstance -ClassName Win32_ComputerSystemProduct | " + queryStr
-                ],
-                text=True
-            ).strip()
+    out = version if version else (csp.get("Name") or "").strip()
 
-            return vendor + ' ' + out
+    return vendor + ' ' + out
 
-        elif system == "Linux":
-            vendor, model = None, None
-            try:
-                with open("/sys/devices/virtual/dmi/id/sys_vendor") as f:
-                    vendor = f.read().strip()
-            except FileNotFoundError:
-                pass
-            try:
-                with open("/sys/devices/virtual/dmi/id/product_name") as f:
-                    model = f.read().strip()
-            except FileNotFoundError:
-                pass
-            
-            if vendor:
-                vendor = vendor.strip()
-
-                # Remove trailing punctuation (.,)
-                vendor = re.sub(r"[.,\s]+$", "", vendor)
-
-                # Remove common company suffixes
-                vendor = re.sub(r"\b(inc|inc\.|ltd|ltd\.|corp|co\.?)\b$", "", vendor, flags=re.IGNORECASE)
-
-                # Remove any leftover trailing punctuation/whitespace again
-                vendor = re.sub(r"[.,\s]+$", "", vendor)
-
-            if vendor and model:
-                return f"{vendor} {model}"
-            elif model:
-                return model
-            elif vendor:
-                return vendor
-            else:
-                return platform.uname().node
+def _get_system_model_linux():
+    vendor = _sysfs("/sys/devices/virtual/dmi/id/sys_vendor")
+    model = _sysfs("/sys/devices/virtual/dmi/id/product_name")
 
-        elif system == "Darwin":  # MacOS
-            APPLE_JSON_URL = "https://raw.githubusercontent.com/kyle-seongwoo-jun/apple-device-identifiers/main/mac-device-identifiers.json"
-            model_map = requests.get(APPLE_JSON_URL, timeout=5).json()
+    if vendor:
+        vendor = _clean_vendor(vendor)
 
-            try:
-                output = subprocess.check_output(
-                    ["system_profiler", "SPHardwareDataType"],
-                    text=True
-                )
-                model_name, model_id = None, None
-                for line in output.splitlines():
-                    if "Model Name:" in line:
-                        model_name = line.split(":", 1)[1].strip()
-                    elif "Model Identifier:" in line:
-                        model_id = line.split(":", 1)[1].strip()
-
-                # Try GitHub JSON mapping first
-                if model_id:
-                    try:
-                        if model_id in model_map:
-                            return merge_model_names(model_map[model_id])
-                    except Exception:
-                        pass  # fall through to our existing logic
+    if vendor and model:
+        return f"{vendor} {model}"
+    elif model:
+        return model
+    elif vendor:
+        return vendor
+    else:
+        return platform.uname().node
 
-                # Fallbacks
-                if model_name and model_id:
-                    return f"Apple {model_name} ({model_id})"
-                elif model_name:
-                    return f"Apple {model_name}"
-                else:
-                    return "Apple Mac"
+def _get_system_model_mac():
+    APPLE_JSON_URL = "https://raw.githubusercontent.com/kyle-seongwoo-jun/apple-device-identifiers/main/mac-device-identifiers.json"
+    model_map = requests.get(APPLE_JSON_URL, timeout=5).json()
+
+    try:
+        output = subprocess.check_output(
+            ["system_profiler", "SPHardwareDataType"],
+            text=True
+        )
+        model_name, model_id = None, None
+        for line in output.splitlines():
+            if "Model Name:" in line:
+                model_name = line.split(":", 1)[1].strip()
+            elif "Model Identifier:" in line:
+                model_id = line.split(":", 1)[1].strip()
+
+        # Try GitHub JSON mapping first
+        if model_id:
+            try:
+                if model_id in model_map:
+                    return merge_model_names(model_map[model_id])
             except Exception:
-                return platform.uname().node
+                pass  # fall through to our existing logic
 
+        # Fallbacks
+        if model_name and model_id:
+            return f"Apple {model_name} ({model_id})"
+        elif model_name:
+            return f"Apple {model_name}"
         else:
-            return platform.uname().node
+            return "Apple Mac"
+    except Exception:
+        return platform.uname().node
 
+def _get_system_model_generic():
+    return platform.uname().node
+
+_system_model_impl = {
+    "Windows": _get_system_model_win,
+    "Linux": _get_system_model_linux,
+    "Darwin": _get_system_model_mac,
+}.get(_SYSTEM, _get_system_model_generic)
+
+@lru_cache(maxsize=1)
+def get_system_model():
+    """Return system model string for Windows/Linux/macOS."""
+    try:
+        return _system_model_impl()
     except Exception:
         return "Unknown System"
 
@@ -208,61 +370,81 @@ def get_system_model():
 # CPU
 # ------------------------------
 
-def get_cpu_info():
-    """Return CPU info dict (raw name, friendly name, cores, threads, speed)."""
-    system = platform.system()
-    raw_name = ""
+def _cpu_raw_name_win():
+    # Registry first: a single in-process winreg call, microseconds, and it
+    # doesn't force the CIM blob fetch when only the CPU name is wanted
+    try:
+        import winreg
+        key = winreg.OpenKey(
+            winreg.HKEY_LOCAL_MACHINE,
+            r"HARDWARE\DESCRIPTION\System\CentralProcessor\0",
+        )
+        raw_name, _ = winreg.QueryValueEx(key, "ProcessorNameString")
+        winreg.CloseKey(key)
+        raw_name = raw_name.strip()
+        if raw_name:
+            return raw_name
+    except Exception:
+        pass
 
-    if system == "Windows":
-        # Try PowerShell
-        try:
-            cmd = ["powershell", "-Command", "(Get-CimInstance Win32_Processor).Name"]
-            raw_name = subprocess.check_output(cmd, text=True).strip()
-        except Exception:
-            pass
+    # Fallback: the batched CIM blob (one spawn shared by the whole module)
+    cpus = _as_list(_win_sysinfo_once().get("CPU"))
+    if cpus:
+        return (cpus[0].get("Name") or "").strip()
+    return ""
 
-        # Fallback: WMIC
-        if not raw_name:
-            try:
-                output = subprocess.check_output(
-                    ["wmic", "cpu", "get", "Name"], text=True
-                ).strip().splitlines()
-                if len(output) > 1:
-                    raw_name = output[1].strip()
-            except Exception:
-                pass
+def _cpu_raw_name_linux():
+    try:
+        # The model name always sits in the first processor block, so one
+        # 4 KB read covers it — no point pulling the full file (~50 KB on a
+        # 128-thread box, repeating the name once per logical CPU).
+        with open("/proc/cpuinfo", "rb") as f:
+            head = f.read(4096)
+        m = _PROC_MODEL_NAME.search(head.decode("ascii", "replace"))
+        if m:
+            return m.group(1).strip()
+    except Exception:
+        pass
+    return ""
 
-    elif system == "Linux":
-        try:
-            with open("/proc/cpuinfo") as f:
-                for line in f:
-                    if "model name" in line:
-                        raw_name = line.split(":")[1].strip()
-                        break
-        except Exception:
-            pass
+def _cpu_raw_name_generic():
+    return ""
 
+_cpu_raw_name_impl = {
+    "Windows": _cpu_raw_name_win,
+    "Linux": _cpu_raw_name_linux,
+}.get(_SYSTEM, _cpu_raw_name_generic)
+
+@lru_cache(maxsize=1)
+def _get_cpu_static():
+    """Name/core fields only — everything that can't change mid-process."""
+    raw_name = _cpu_raw_name_impl()
     if not raw_name:
         raw_name = platform.processor()
 
-    friendly_name = make_friendly_cpu_name(raw_name)
-    cpu_count = psutil.cpu_count(logical=True)
-    cpu_physical = psutil.cpu_count(logical=False)
+    return {
+        "CPU Name (Raw)": raw_name,
+        "CPU Name (Friendly)": make_friendly_cpu_name(raw_name),
+        "Cores (Physical)": _PHYSICAL,
+        "Threads (Logical)": _LOGICAL,
+    }
+
+def get_cpu_info():
+    """Return CPU info dict (raw name, friendly name, cores, threads, speed).
+
+    The static fields come from a cached helper; only the cheap cpu_freq()
+    call runs per invocation, so "Current (MHz)" stays fresh.
+    """
+    info = dict(_get_cpu_static())
 
     freq = psutil.cpu_freq()
-    cpu_speed = {
+    info["Clock Speed"] = {
         "Min (MHz)": round(freq.min, 2),
         "Max (MHz)": round(freq.max, 2),
         "Current (MHz)": round(freq.current, 2)
     } if freq else "Unavailable"
 
-    return {
-        "CPU Name (Raw)": raw_name,
-        "CPU Name (Friendly)": friendly_name,
-        "Cores (Physical)": cpu_physical,
-        "Threads (Logical)": cpu_count,
-        "Clock Speed": cpu_speed
-    }
+    return info
 
 
 def make_friendly_cpu_name(raw_name):
@@ -270,11 +452,11 @@ def make_friendly_cpu_name(raw_name):
     if not raw_name:
         return "Unknown CPU"
 
-    name = re.sub(r"\(R\)|\(TM\)|CPU|@.*GHz", "", raw_name, flags=re.IGNORECASE)
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _CPU_STRIP.sub("", raw_name)
+    name = _WS.sub(" ", name).strip()
 
     # Intel Core parsing
-    match = re.search(r"(i3|i5|i7|i9)-(\d{3,5})", name)
+    match = _INTEL_CORE.search(name)
     if match:
         family, model_num = match.groups()
         model_num = int(model_num)
@@ -297,386 +479,432 @@ def make_friendly_cpu_name(raw_name):
 # RAM
 # ------------------------------
 
-def get_ram_info():
-    """
-    Return advertised RAM total (GB), individual DIMM sizes, and memory speeds.
-    Uses PowerShell on Windows and dmidecode on Linux.
-    Reports sizes as whole-number GiB (to match DIMM labels).
+@lru_cache(maxsize=1)
+def get_ram_totals_only():
+    """RAM totals with zero subprocess cost, for callers that don't need DIMM detail.
+
+    psutil.virtual_memory().total answers in-process on every OS; the full
+    get_ram_info path may shell out (decode-dimms, system_profiler) for
+    type/speed info that totals-only callers never look at.
     """
-    system = platform.system()
-    ram_info = {
+    total_bytes = psutil.virtual_memory().total
+    gib = total_bytes / (1024**3)
+    return {
+        "Advertised RAM (GB)": int(math.ceil(gib / 4.0)) * 4,  # round up to nearest 4 GB
+        "Usable RAM (GiB)": round(gib, 2),
+    }
+
+def _ram_defaults():
+    return {
         "Advertised RAM (GB)": None,
         "DIMM Sizes (GB)": [],
         "Memory Speed (MHz)": []
     }
 
-    if system == "Windows":
-        try:
-            cmd = [
-                "powershell", "-Command",
-                "$ProgressPreference = 'SilentlyContinue'; "
-                "Get-CimInstance Win32_PhysicalMemory | "
-                "Select-Object Capacity, Speed, SMBIOSMemoryType | ConvertTo-Json"
-            ]
-            output = subprocess.check_output(cmd, text=True).strip()
-
-            import json
-            dimms = json.loads(output)
-            if isinstance(dimms, dict):
-                dimms = [dimms]
-
-            sizes, speeds, types = [], [], []
-            type_map = {
-                20: "DDR",
-                21: "DDR2",
-                24: "DDR3",
-                26: "DDR4",
-                27: "LPDDR",
-                28: "LPDDR2",
-                29: "LPDDR3",
-                30: "LPDDR4",
-            }
-
-            for d in dimms:
-                cap = int(d.get("Capacity", 0) or 0)
-                spd = d.get("Speed")
-                tcode = d.get("SMBIOSMemoryType")
-
-                if cap:
-                    gib = cap / (1024 ** 3)  # bytes → GiB
-                    val = round(gib, 2)
-                    # if val is an integer, make it int not float
-                    if val.is_integer():
-                        val = int(val)
-                    sizes.append(val)
-
-                if spd and str(spd).isdigit():
-                    speeds.append(int(spd))
-                if tcode and str(tcode).isdigit():
-                    tcode = int(tcode)
-                    if tcode in type_map:
-                        types.append(type_map[tcode])
-
-            total = sum(sizes) if sizes else None
-            if total is not None and isinstance(total, float) and total.is_integer():
-                total = int(total)
+def _get_ram_info_win(dimm_detail=False):
+    ram_info = _ram_defaults()
+    try:
+        dimms = _as_list(_win_sysinfo_once().get("MEM"))
 
-            ram_info["DIMM Sizes (GB)"] = sizes
-            ram_info["Advertised RAM (GB)"] = total
-            if speeds:
-                ram_info["Memory Speed (MHz)"] = sorted(set(speeds))
-            if types:
-                ram_info["Memory Type"] = types[0] if all(x == types[0] for x in types) else types
+        sizes, types, speeds = [], [], []
+        type_map = {
+            20: "DDR",
+            21: "DDR2",
+            24: "DDR3",
+            26: "DDR4",
+            27: "LPDDR",
+            28: "LPDDR2",
+            29: "LPDDR3",
+            30: "LPDDR4",
+        }
+
+        for d in dimms:
+            cap = int(d.get("Capacity", 0) or 0)
+            spd = d.get("Speed")
+            tcode = d.get("SMBIOSMemoryType")
+
+            if cap:
+                # Capacities stay integer bytes; whole-GiB DIMMs (the normal
+                # case) convert with a shift and a modulo test instead of a
+                # float divide + round + is_integer round-trip.
+                sizes.append(cap >> 30 if cap % (1 << 30) == 0 else round(cap / (1 << 30), 2))
+
+            # CIM/ConvertTo-Json already deliver ints — no str round-trip
+            if isinstance(spd, int) and spd:
+                speeds.append(spd)
+            if isinstance(tcode, int) and tcode in type_map:
+                types.append(type_map[tcode])
+
+        total = sum(sizes) if sizes else None
+        if total is not None and isinstance(total, float) and total.is_integer():
+            total = int(total)
+
+        ram_info["DIMM Sizes (GB)"] = sizes
+        ram_info["Advertised RAM (GB)"] = total
+        if speeds:
+            ram_info["Memory Speed (MHz)"] = sorted(set(speeds))
+        if types:
+            ram_info["Memory Type"] = types[0] if all(x == types[0] for x in types) else types
 
-        except Exception as e:
-            ram_info["Error"] = f"Windows query failed: {e}"
+    except Exception as e:
+        ram_info["Error"] = f"Windows query failed: {e}"
+    return ram_info
 
-    elif system == "Linux":
-        ram_info["IsLikelyDDR"] = None  # default        
-        sizes, types, speeds = [], [], []
+def _get_ram_info_linux(dimm_detail=False):
+    ram_info = _ram_defaults()
+    ram_info["IsLikelyDDR"] = None  # default
+    sizes, types, speeds = [], [], []
 
-        # ✅ Always get usable/total memory from /proc/meminfo
-        try:
-            with open("/proc/meminfo") as f:
-                for line in f:
-                    if line.startswith("MemTotal:"):
-                        kb = int(line.split()[1])  # value in kB
-                        gib = kb / 1024**2        # kB → GiB
-                        advertised_ram = int(math.ceil(gib / 4.0)) * 4  # round up to nearest 4 GB
-                        ram_info["Advertised RAM (GB)"] = advertised_ram
-                        ram_info["DIMM Sizes (GB)"] = [round(gib, 2)]
-                        ram_info["Usable RAM (GiB)"] = round(gib, 2)
-                        break
-        except Exception as e:
-            ram_info["Error"] = f"/proc/meminfo query failed: {e}"
+    # ✅ Always get usable/total memory from /proc/meminfo
+    try:
+        # MemTotal is guaranteed to be the first line, so 128 bytes is plenty
+        # — one short read instead of pulling and scanning the whole file
+        with open("/proc/meminfo") as f:
+            head = f.read(128)
+        kb = int(head.split(None, 3)[1])  # "MemTotal: <kB> kB ..."
+        gib = kb / 1024**2                # kB → GiB
+        advertised_ram = int(math.ceil(gib / 4.0)) * 4  # round up to nearest 4 GB
+        ram_info["Advertised RAM (GB)"] = advertised_ram
+        ram_info["DIMM Sizes (GB)"] = [round(gib, 2)]
+        ram_info["Usable RAM (GiB)"] = round(gib, 2)
+    except Exception as e:
+        ram_info["Error"] = f"/proc/meminfo query failed: {e}"
 
-        # ✅ Try decode-dimms for type + speed (optional)
-        try:
-            output = subprocess.check_output(
-                ["decode-dimms"], text=True, stderr=subprocess.DEVNULL
-            )
+    # ✅ Try decode-dimms for type + speed (optional)
+    try:
+        # Stream the output instead of buffering it whole (tens of KB per
+        # DIMM) and stop as soon as both fields are in hand — DIMM kits are
+        # matched in practice, so the first module answers for all of them
+        base_type = None
+        max_speed = None
+        with subprocess.Popen(
+            ["decode-dimms"], stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True, bufsize=65536
+        ) as proc:
+            for line in proc.stdout:
+                stripped = line.lstrip()
+                if stripped.startswith("Fundamental Memory type"):
+                    for tok in stripped.split():
+                        if tok.startswith("DDR"):
+                            base_type = tok.split("-")[0]
+                            break
+                elif stripped.startswith("Maximum module speed"):
+                    parts = stripped.split()
+                    for i, tok in enumerate(parts):
+                        if tok == "MHz" and i and parts[i - 1].isdigit():
+                            max_speed = int(parts[i - 1])
+                            break
+                if base_type and max_speed:
+                    proc.terminate()
+                    break
+            if proc.wait() != 0 and base_type is None:
+                raise subprocess.CalledProcessError(proc.returncode, "decode-dimms")
+        ram_info["IsLikelyDDR"] = True
+
+        if base_type:
+            ram_info["Memory Type"] = base_type
+        if max_speed:
+            ram_info["Memory Speed (MHz)"] = [max_speed]
 
-            raw_types = re.findall(r"(DDR\d(?:-\d+)?)", output)
-            raw_types = list(set(raw_types))  # deduplicate
-            ram_info["IsLikelyDDR"] = True
-
-            if raw_types:
-                base_type = None
-                max_speed = None
-                for t in raw_types:
-                    if "-" in t:
-                        family, mhz = t.split("-")
-                        mhz = int(mhz)
-                        if max_speed is None or mhz > max_speed:
-                            max_speed = mhz
-                        base_type = family
-                    else:
-                        base_type = t
-                if base_type:
-                    ram_info["Memory Type"] = base_type
-                if max_speed:
-                    ram_info["Memory Speed (MHz)"] = [max_speed]
-
-        except Exception:
-            # CPU fallback if still unknown
-            if ram_info.get("IsLikelyDDR") is None:
-                try:
-                    with open("/proc/cpuinfo") as f:
-                        cpuinfo = f.read()
-                    if re.search(r"(Core|Xeon|Pentium\s4|Celeron\sD|Athlon\s64|Opteron|Turion|Phenom|i[3579]|Ryzen)", cpuinfo, re.I):
-                        ram_info["IsLikelyDDR"] = True
-                    else:
-                        ram_info["IsLikelyDDR"] = False
-                except Exception:
+    except Exception:
+        # CPU fallback if still unknown
+        if ram_info.get("IsLikelyDDR") is None:
+            try:
+                with open("/proc/cpuinfo") as f:
+                    cpuinfo = f.read()
+                if _DDR_CPU_HINT.search(cpuinfo):
+                    ram_info["IsLikelyDDR"] = True
+                else:
                     ram_info["IsLikelyDDR"] = False
+            except Exception:
+                ram_info["IsLikelyDDR"] = False
 
-            if ram_info["IsLikelyDDR"]: 
-                ram_info["Memory Type"] = "DDR"
-            else:
-                ram_info["Memory Type"] = ""
+        if ram_info["IsLikelyDDR"]: 
+            ram_info["Memory Type"] = "DDR"
+        else:
+            ram_info["Memory Type"] = ""
 
-    elif system == "Darwin":  # macOS
-        try:
-            # Total RAM
-            total_bytes = int(subprocess.check_output(
-                ["sysctl", "-n", "hw.memsize"], text=True).strip()
-            )
-            ram_info["Advertised RAM (GB)"] = round(total_bytes / (1024**3))
+    return ram_info
 
-            sizes, speeds, types = [], [], []
+def _get_ram_info_mac(dimm_detail=False):
+    ram_info = _ram_defaults()
+    try:
+        # Total RAM straight from the kernel — single fast sysctl
+        total_bytes = int(subprocess.check_output(
+            ["sysctl", "-n", "hw.memsize"], text=True).strip()
+        )
+        ram_info["Advertised RAM (GB)"] = round(total_bytes / (1024**3))
+        ram_info["Usable RAM (GiB)"] = round(total_bytes / (1024**3), 2)
 
-            # Always parse plain text (since XML is unreliable on older Macs)
-            text_out = subprocess.check_output(
-                ["system_profiler", "SPMemoryDataType"],
-                text=True, errors="ignore"
-            )
+        if not dimm_detail:
+            return ram_info
 
-            # Sizes (lines like "Size: 2 GB")
-            size_matches = re.findall(r"Size:\s+(\d+)\s+GB", text_out)
-            if size_matches:
-                sizes = [int(s) for s in size_matches if s.isdigit()]
-
-            # Types: "Type: DDR3" or "Type: Empty"
-            type_matches = re.findall(r"Type:\s*([A-Za-z0-9]+)", text_out, flags=re.IGNORECASE)
-            if type_matches:
-                # Remove "Empty"
-                cleaned_types = [t for t in type_matches if t.lower() != "empty"]
-
-                if cleaned_types:
-                    # Collapse to single string if all the same
-                    if all(x == cleaned_types[0] for x in cleaned_types):
-                        ram_info["Memory Type"] = cleaned_types[0]
-                    else:
-                        ram_info["Memory Type"] = cleaned_types
-
-            if types:
-                ram_info["Memory Type"] = types[0] if len(types) == 1 else types
-
-            # Speeds (lines like "Speed: 1333 MHz" or "Maximum Speed: 1600 MHz")
-            max_speeds = re.findall(r"Maximum Speed:\s+(\d+)\s+MHz", text_out)
-            cfg_speeds = re.findall(r"Speed:\s+(\d+)\s+MHz", text_out)
-
-            speeds = []
-            if max_speeds:
-                speeds = [int(s) for s in max_speeds if s.isdigit()]
-            elif cfg_speeds:
-                speeds = [int(s) for s in cfg_speeds if s.isdigit()]
-
-            # Populate results
-            if sizes:
-                ram_info["DIMM Sizes (GB)"] = sizes
-            if speeds:
-                ram_info["Memory Speed (MHz)"] = sorted(set(speeds))
-            if types:
-                ram_info["Memory Type"] = types[0] if len(types) == 1 else types
-
-            # Slot count
-            slot_matches = re.findall(r"BANK \d+/DIMM\d+:", text_out)
-            ram_info["Slots Used"] = len(sizes)
-            ram_info["Slots Total"] = len(slot_matches)
+        sizes = []
 
-        except Exception as e:
-            ram_info["Error"] = f"macOS query failed: {e}"
+        # Always parse plain text (since XML is unreliable on older Macs)
+        text_out = subprocess.check_output(
+            ["system_profiler", "SPMemoryDataType"],
+            text=True, errors="ignore"
+        )
+
+        # Sizes (lines like "Size: 2 GB")
+        size_matches = _SIZE_GB.findall(text_out)
+        if size_matches:
+            sizes = [int(s) for s in size_matches if s.isdigit()]
+
+        # Types: "Type: DDR3" or "Type: Empty"
+        type_matches = _MEM_TYPE.findall(text_out)
+        if type_matches:
+            # Remove "Empty"
+            cleaned_types = [t for t in type_matches if t.lower() != "empty"]
+
+            if cleaned_types:
+                # Collapse to single string if all the same
+                if all(x == cleaned_types[0] for x in cleaned_types):
+                    ram_info["Memory Type"] = cleaned_types[0]
+                else:
+                    ram_info["Memory Type"] = cleaned_types
 
+        # Speeds (lines like "Speed: 1333 MHz" or "Maximum Speed: 1600 MHz")
+        max_speeds = _SPEED_MAX.findall(text_out)
+        cfg_speeds = _SPEED_CFG.findall(text_out)
 
+        speeds = []
+        if max_speeds:
+            speeds = [int(s) for s in max_speeds if s.isdigit()]
+        elif cfg_speeds:
+            speeds = [int(s) for s in cfg_speeds if s.isdigit()]
 
-    else:
-        ram_info["Error"] = "Unsupported OS"
+        # Populate results
+        if sizes:
+            ram_info["DIMM Sizes (GB)"] = sizes
+        if speeds:
+            ram_info["Memory Speed (MHz)"] = sorted(set(speeds))
+
+        # Slot count
+        slot_matches = _BANK.findall(text_out)
+        ram_info["Slots Used"] = len(sizes)
+        ram_info["Slots Total"] = len(slot_matches)
+
+    except Exception as e:
+        ram_info["Error"] = f"macOS query failed: {e}"
 
     return ram_info
 
+def _get_ram_info_generic(dimm_detail=False):
+    ram_info = _ram_defaults()
+    ram_info["Error"] = "Unsupported OS"
+    return ram_info
+
+_ram_info_impl = {
+    "Windows": _get_ram_info_win,
+    "Linux": _get_ram_info_linux,
+    "Darwin": _get_ram_info_mac,
+}.get(_SYSTEM, _get_ram_info_generic)
+
+@lru_cache(maxsize=2)
+def get_ram_info(dimm_detail=False):
+    """
+    Return advertised RAM total (GB), individual DIMM sizes, and memory speeds.
+    Uses PowerShell on Windows and dmidecode on Linux.
+    Reports sizes as whole-number GiB (to match DIMM labels).
+
+    On macOS, per-DIMM type/speed/slot info requires the slow (~2-3 s)
+    system_profiler plugin stack; pass dimm_detail=True to opt in. The
+    default answers from sysctl alone in a few ms.
+    """
+    return _ram_info_impl(dimm_detail)
+
 
 # ------------------------------
 # Storage
 # ------------------------------
 
+_UNITS = (("B", 1), ("KB", 1000), ("MB", 1000**2), ("GB", 1000**3), ("TB", 1000**4))
+
 def bytes_to_str(size_bytes):
-    """Convert size in bytes to a human-readable string in GB."""
+    """Convert a byte count to a human-readable string (KB/MB/GB/TB, base 1000)."""
     if size_bytes is None:
         return "Unknown"
-    size_tb = round(size_bytes / (1000**4))
-    size_gb = round(size_bytes / (1000**3))
-    size_mb = round(size_bytes / (1000**2))
-    size_kb = round(size_bytes / 1000)
-    return f"{size_tb}TB" if size_gb >= 1000 else f"{size_gb}GB" if size_mb >= 1000 else f"{size_mb}MB" if size_kb >= 1000 else f"{size_kb}KB" if size_kb >= 1  else f"{size_bytes}B"
+    # Pick the unit straight from the magnitude: one log + one lookup instead
+    # of dividing/rounding for every unit and walking a ternary chain.
+    idx = 0 if size_bytes < 1 else min(4, int(math.log10(size_bytes) // 3))
+    unit, divisor = _UNITS[idx]
+    return f"{round(size_bytes / divisor)}{unit}"
 
 def is_linux_storage_removable(dev_name: str) -> bool:
     """
     Returns True if the given device is removable, False otherwise.
     dev_name is like 'sda', 'nvme0n1', etc.
     """
-    removable_path = f"/sys/block/{dev_name}/removable"
-    try:
-        with open(removable_path) as f:
-            return f.read().strip() == "1"
-    except FileNotFoundError:
-        return False
+    return _sysfs(f"/sys/block/{dev_name}/removable") == "1"
     
-def get_storage_info():
-    """Return list of storage devices with model, size, bus type, and media type (HDD/SSD/USB/NVMe/MMC)."""
+# MSFT_PhysicalDisk enum codes; ConvertTo-Json/wmi emit these as ints
+_BUS_TYPE_CODES = {
+    3: "ATA", 7: "USB", 8: "RAID", 10: "SAS", 11: "SATA",
+    12: "SD", 13: "MMC", 17: "NVME",
+}
+_MEDIA_TYPE_CODES = {3: "HDD", 4: "SSD", 5: "SCM"}
+
+def _decode_enum(value, codes):
+    if isinstance(value, int):
+        return codes.get(value, "")
+    return str(value or "").upper()
+
+def _win_media_type(bus, media):
+    if bus == "USB":
+        return "USB"
+    if bus in ("NVME", "SATA"):
+        return media if media in ("SSD", "HDD") else bus
+    return bus or "Unknown"
+
+def _get_storage_info_win():
     drives = []
-    system = platform.system()
 
-    if system == "Windows":
+    # Preferred: physical disks from the batched CIM blob (no extra spawn)
+    disks = _as_list(_win_sysinfo_once().get("DISK"))
+    if disks:
+        for d in disks:
+            size = d.get("Size")
+            bus = _decode_enum(d.get("BusType"), _BUS_TYPE_CODES)
+            media = _decode_enum(d.get("MediaType"), _MEDIA_TYPE_CODES)
+            drives.append({
+                "Model": d.get("FriendlyName"),
+                "Manufacturer": d.get("Manufacturer"),
+                "Serial": d.get("SerialNumber"),
+                "Size": bytes_to_str(int(size)) if isinstance(size, (int, float)) and size else None,
+                "BusType": bus,
+                "MediaType": _win_media_type(bus, media),
+            })
+        return drives
+
+    # Fallback: dedicated PowerShell query with Format-List text output
+    try:
+        cmd = [
+            "powershell", "-Command",
+            "Get-PhysicalDisk | Select-Object FriendlyName, Manufacturer, "
+            "SerialNumber, Size, BusType, MediaType | Format-List"
+        ]
+        output = subprocess.check_output(cmd, text=True)
+        # Plain split beats the regex engine here; text=True already folded
+        # CRLFs, and the drive_info guard below skips any stray empty blocks
+        blocks = output.strip().split("\n\n")
+        for block in blocks:
+            drive_info = {}
+            for line in block.splitlines():
+                if ":" in line:
+                    key, val = line.split(":", 1)
+                    drive_info[key.strip()] = val.strip()
+            if drive_info:
+                size = drive_info.get("Size")
+                bus = drive_info.get("BusType", "").upper()
+                media = drive_info.get("MediaType", "").upper()
+
+                drives.append({
+                    "Model": drive_info.get("FriendlyName"),
+                    "Manufacturer": drive_info.get("Manufacturer"),
+                    "Serial": drive_info.get("SerialNumber"),
+                    "Size": bytes_to_str(int(size)) if size and size.isdigit() else size if size else None,
+                    "BusType": bus,
+                    "MediaType": _win_media_type(bus, media)
+                })
+    except Exception as e:
+        drives.append({"Error": str(e)})
+    return drives
+
+def _get_storage_info_linux():
+    drives = []
+    output = subprocess.check_output(
+        ["lsblk", "-J", "-bd", "-o", "NAME,MODEL,VENDOR,SERIAL,SIZE,TRAN"],
+        stderr=subprocess.DEVNULL, text=True
+    )
+    blockdevices = _jloads(output)['blockdevices']
+
+    # Tuple-startswith is a single C call; skips loop/ram pseudo-devices
+    storagedevices = [
+        dev for dev in blockdevices
+        if not dev.get("name", "").startswith(("loop", "ram"))
+    ]
+
+    for dev in storagedevices:
         try:
-            cmd = [
-                "powershell", "-Command",
-                "Get-PhysicalDisk | Select-Object FriendlyName, Manufacturer, "
-                "SerialNumber, Size, BusType, MediaType | Format-List"
-            ]
-            output = subprocess.check_output(cmd, text=True)
-            blocks = re.split(r"\n\s*\n", output.strip())
-            for block in blocks:
-                drive_info = {}
-                for line in block.splitlines():
-                    if ":" in line:
-                        key, val = line.split(":", 1)
-                        drive_info[key.strip()] = val.strip()
-                if drive_info:
-                    size = drive_info.get("Size")
-                    bus = drive_info.get("BusType", "").upper()
-                    media = drive_info.get("MediaType", "").upper()
-
-                    # Decide MediaType
-                    if bus == "USB":
-                        media_type = "USB"
-                    elif bus in ("NVME", "SATA"):
-                        if media == "SSD":
-                            media_type = "SSD"
-                        elif media == "HDD":
-                            media_type = "HDD"
-                        else:
-                            media_type = bus  # fallback
-                    else:
-                        media_type = bus or "Unknown"
-
-                    drives.append({
-                        "Model": drive_info.get("FriendlyName"),
-                        "Manufacturer": drive_info.get("Manufacturer"),
-                        "Serial": drive_info.get("SerialNumber"),
-                        "Size": bytes_to_str(int(size)) if size and size.isdigit() else size if size else None,
-                        "BusType": bus,
-                        "MediaType": media_type
-                    })
+            name = _strip(dev.get("name"))
+            model = _strip(dev.get("model", ""))
+            vendor = _strip(dev.get("vendor", ""))
+            serial = _strip(dev.get("serial", ""))
+            size = _strip(dev.get("size", ""))
+            tran = dev.get("tran", "").strip().upper() if dev.get("tran") else "UNKNOWN"
+
+            dev_path = f"/dev/{name}"
+            bus = tran.upper()
+            bus = bus.split(' ')[-1]
+
+            # Rotational flag for HDD/SSD
+            rota_path = f"/sys/block/{name}/queue/rotational"
+            media_type = bus.split(' ')[-1]
+
+            rota = _sysfs(rota_path)
+            if bus in ("SATA", "NVME"):
+                media_type = "SSD" if rota == "0" else "HDD"
+
+            drives.append({
+                "Device": dev_path,
+                "Model": model,
+                "Vendor": vendor,
+                "Serial": serial,
+                "Size": size if size and isinstance(size, str) else bytes_to_str(int(size)) if size else None,
+                "BusType": bus,
+                "MediaType": media_type
+            })
         except Exception as e:
             drives.append({"Error": str(e)})
+    return drives
 
-    elif system == "Linux":
-        output = subprocess.check_output(
-            ["lsblk", "-J", "-bd", "-o", "NAME,MODEL,VENDOR,SERIAL,SIZE,TRAN"],
-            stderr=subprocess.DEVNULL, text=True
-        )
-        output = json.loads(output)
-        blockdevices = output['blockdevices']
-
-        storagedevices = []
-        for dev in blockdevices:
-            name = dev.get("name")
-            if not name.startswith("loop") and not name.startswith("ram"):
-                storagedevices.append(dev)
+def _get_storage_info_mac():
+    drives = []
+    try:
+        # -plist output parses in-process with plistlib — no text scraping —
+        # and WholeDisks limits the follow-up info calls to physical disks
+        # instead of every partition/APFS volume in the listing.
+        listing = plistlib.loads(subprocess.check_output(["diskutil", "list", "-plist"]))
 
-        for dev in storagedevices:
+        for dev in listing.get("WholeDisks", []):
             try:
-                name = dev.get("name")
-                model = dev.get("model", "")
-                vendor = dev.get("vendor", "")
-                serial = dev.get("serial", "")
-                size = dev.get("size", "")
-                tran = dev.get("tran", "").strip().upper() if dev.get("tran") else "UNKNOWN"
-
-                name = name.strip() if isinstance(name, str) else name
-                model = model.strip() if isinstance(model, str) else model
-                vendor = vendor.strip() if isinstance(vendor, str) else vendor
-                serial = serial.strip() if isinstance(serial, str) else serial
-                size = size.strip() if isinstance(size, str) else size
-
-                dev_path = f"/dev/{name}"
-                bus = tran.upper()
-                bus = bus.split(' ')[-1]
-
-                # Rotational flag for HDD/SSD
-                rota_path = f"/sys/block/{name}/queue/rotational"
-                media_type = bus.split(' ')[-1]
-
-                with open(rota_path) as f:
-                    rota = f.read().strip()
-                    if bus in ("SATA", "NVME"):
-                        media_type = "SSD" if rota == "0" else "HDD"
+                info = plistlib.loads(
+                    subprocess.check_output(["diskutil", "info", "-plist", dev])
+                )
+
+                if "SolidState" in info:
+                    media_type = "SSD" if info["SolidState"] else "HDD"
+                else:
+                    media_type = str(info.get("BusProtocol") or "").upper() or None  # e.g. USB
 
                 drives.append({
-                    "Device": dev_path,
-                    "Model": model,
-                    "Vendor": vendor,
-                    "Serial": serial,
-                    "Size": size if size and isinstance(size, str) else bytes_to_str(int(size)) if size else None,
-                    "BusType": bus,
-                    "MediaType": media_type
+                    "Device": f"/dev/{dev}",
+                    "Model": info.get("MediaName"),
+                    "Size": bytes_to_str(info.get("TotalSize")),
+                    "MediaType": media_type or "Unknown",
                 })
-            except Exception as e:
-                drives.append({"Error": str(e)})
+            except Exception:
+                continue
+    except Exception as e:
+        drives.append({"Error": str(e)})
 
+    return drives
 
-    elif system == "Darwin":  # macOS
-        try:
-            disk_list = subprocess.check_output(
-                ["diskutil", "list"], text=True
-            ).strip().splitlines()
-
-            for line in disk_list:
-                m = re.match(r"^\s*(\S+)\s+\(.*\):", line)
-                if m:
-                    dev = m.group(1)  # e.g. disk0
-                    try:
-                        info = subprocess.check_output(
-                            ["diskutil", "info", dev], text=True
-                        )
-                        drive = {"Device": f"/dev/{dev}"}
-                        media_type, size = None, None
-                        for l in info.splitlines():
-                            if "Device / Media Name:" in l:
-                                drive["Model"] = l.split(":", 1)[1].strip()
-                            elif "Disk Size:" in l and "(" in l:
-                                size = l.split("(")[0].split(":")[1].strip()
-                            elif "Solid State:" in l:
-                                if "Yes" in l:
-                                    media_type = "SSD"
-                                elif "No" in l:
-                                    media_type = "HDD"
-                            elif "Protocol:" in l:
-                                proto = l.split(":", 1)[1].strip().upper()
-                                if media_type is None:
-                                    media_type = proto  # e.g. USB
-
-                        drive["Size"] = size
-                        drive["MediaType"] = media_type or "Unknown"
-                        drives.append(drive)
+def _get_storage_info_generic():
+    return []
 
-                    except Exception:
-                        continue
-        except Exception as e:
-            drives.append({"Error": str(e)})
+_storage_info_impl = {
+    "Windows": _get_storage_info_win,
+    "Linux": _get_storage_info_linux,
+    "Darwin": _get_storage_info_mac,
+}.get(_SYSTEM, _get_storage_info_generic)
 
-    return drives
+@lru_cache(maxsize=1)
+def get_storage_info():
+    """Return list of storage devices with model, size, bus type, and media type (HDD/SSD/USB/NVMe/MMC)."""
+    return _storage_info_impl()
 
 
 # ------------------------------
@@ -701,6 +929,12 @@ def get_MacOS_version() -> str:
         return f"macOS (Darwin {platform.release()}) - version lookup failed: {e}"
 
 def get_linux_distro():
+    try:
+        # Stdlib parser (3.10+) handles quoting/escapes the manual split didn't
+        data = platform.freedesktop_os_release()
+        return f"{data.get('NAME')} {data.get('VERSION')}"
+    except Exception:
+        pass
     try:
         with open("/etc/os-release") as f:
             data = {}
@@ -712,36 +946,76 @@ def get_linux_distro():
     except Exception:
         return f"Linux {platform.release()}"
     
+def _get_os_info_win():
+    # In-process first: win32_ver/win32_edition read the registry directly,
+    # no CIM round trip needed for a Caption-style string
+    try:
+        release, version, _csd, _ptype = platform.win32_ver()
+        edition = platform.win32_edition() or ""
+        if release:
+            return f"Windows {release} {edition} {version}".replace("  ", " ").strip()
+    except Exception:
+        pass
+
+    caption = (_win_sysinfo_once().get("OS") or "").strip()
+    return caption if caption else f"Windows {platform.release()}"
+
+def _get_os_info_generic():
+    return f"{_SYSTEM} {platform.release()}"
+
+_os_info_impl = {
+    "Linux": get_linux_distro,
+    "Darwin": get_MacOS_version,
+    "Windows": _get_os_info_win,
+}.get(_SYSTEM, _get_os_info_generic)
+
+@lru_cache(maxsize=1)
 def get_os_info():
-    system = platform.system()
-    if system == "Linux":
-        return get_linux_distro()
-    elif system == "Darwin":
-        return get_MacOS_version()
-    elif system == "Windows":
-        try:
-            cmd = ["powershell", "-Command", "(Get-CimInstance Win32_OperatingSystem).Caption"]
-            return subprocess.check_output(cmd, text=True).strip()
-        except Exception:
-            return f"Windows {platform.release()}"
-    else:
-        return f"{system} {platform.release()}"
+    return _os_info_impl()
 
 # ------------------------------
 # GPU
 # ------------------------------
 
+def _nvml_gpus():
+    driver = pynvml.nvmlSystemGetDriverVersion()
+    if isinstance(driver, bytes):
+        driver = driver.decode()
+    gpus = []
+    for i in range(pynvml.nvmlDeviceGetCount()):
+        handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+        name = pynvml.nvmlDeviceGetName(handle)
+        if isinstance(name, bytes):
+            name = name.decode()
+        mem_mb = pynvml.nvmlDeviceGetMemoryInfo(handle).total >> 20
+        if mem_mb >= 1024 and mem_mb & (mem_mb - 1) == 0:
+            gpu_memory_str = f"{mem_mb >> 10}GB"
+        else:
+            gpu_memory_str = f"{mem_mb}MB"
+        gpus.append({
+            "GPU": f"{name} {gpu_memory_str}",
+            "GPU Name": name,
+            "GPU Memory": gpu_memory_str,
+            "Driver Version": driver
+        })
+    return gpus
+
+@lru_cache(maxsize=1)
 def get_gpu_info():
     """Return GPU info dict (raw name, friendly name, memory, driver version)."""
     gpus = []
     try:
+        if checkNVML:
+            return _nvml_gpus()
         gpu_list = GPUtil.getGPUs()
         for gpu in gpu_list:
             gpu_memory = gpu.memoryTotal if gpu.memoryTotal else None
             if gpu_memory and isinstance(gpu_memory, float) and gpu_memory.is_integer():
                 gpu_memory = int(gpu_memory)
-                if math.log(gpu_memory,2) >= 10 and math.log(gpu_memory,2).is_integer():    
-                    gpu_memory_str = f"{gpu_memory//1024}GB"
+                # Power-of-two >= 1 GiB check via bit ops — exact on ints,
+                # unlike the float log(x, 2) round-trip it replaces
+                if gpu_memory >= 1024 and gpu_memory & (gpu_memory - 1) == 0:
+                    gpu_memory_str = f"{gpu_memory >> 10}GB"
                 else:
                     gpu_memory_str = f"{gpu_memory}MB"
             else:
@@ -765,16 +1039,34 @@ def get_gpu_info():
 # ------------------------------
 
 def get_system_diagnostics():
-    """Collect system diagnostics into a dictionary."""
-    diagnostics = {
-        "System": get_system_model(),
-        "CPU": get_cpu_info(),
-        "RAM": get_ram_info(),
-        "Storage": get_storage_info(),
-        "OS": get_os_info(),
-        "GPU": get_gpu_info() if checkGPU else []           
-    }
-    return diagnostics
+    """Collect system diagnostics into a dictionary.
+
+    The six getters are independent and block on subprocesses (powershell,
+    lsblk, diskutil, nvidia-smi, ...), which release the GIL while waiting,
+    so a thread pool collapses total wall time from the sum of the calls to
+    roughly the slowest one.
+    """
+    getters = [
+        ("System", get_system_model),
+        ("CPU", get_cpu_info),
+        ("RAM", get_ram_info),
+        ("Storage", get_storage_info),
+        ("OS", get_os_info),
+        ("GPU", get_gpu_info if checkGPU else lambda: []),
+    ]
+    with ThreadPoolExecutor(max_workers=len(getters)) as ex:
+        futures = {key: ex.submit(fn) for key, fn in getters}
+        return {key: f.result() for key, f in futures.items()}
+
+
+def clear_sysinfo_cache():
+    """Reset every memoized lookup (e.g. after a hardware change on a VM)."""
+    global _WIN_SYSINFO
+    _WIN_SYSINFO = None
+    _sysfs_cache.clear()
+    for fn in (get_system_model, _get_cpu_static, get_ram_info,
+               get_storage_info, get_os_info, get_gpu_info):
+        fn.cache_clear()
 
 
 def system_summary():
@@ -790,8 +1082,8 @@ def system_summary():
     threads = sysinfo["CPU"].get("Threads (Logical)", "?")
 
     if cpu.endswith(")"):
-        # Insert before closing parenthesis
-        cpu = re.sub(r"\)$", f", {cores}c/{threads}t)", cpu)
+        # Insert before closing parenthesis — plain slice, no regex needed
+        cpu = f"{cpu[:-1]}, {cores}c/{threads}t)"
     else:
         cpu += f" ({cores}c/{threads}t)"
 
@@ -829,7 +1121,9 @@ def system_summary():
     if checkGPU:
         gpu_info = sysinfo["GPU"]
         if gpu_info and isinstance(gpu_info, list) and "Error" not in gpu_info[0]:
-            gpu = ",".join([f"{info['GPU']} " for info in gpu_info]).strip()
+            # Generator straight into join — no intermediate list, no
+            # per-entry trailing space to strip afterwards
+            gpu = ",".join(info["GPU"] for info in gpu_info)
 
     retStr = f"{system_model} | {cpu} CPU | {ram_str} | {storage_str} | {os_info} OS"
     if gpu:
@@ -844,15 +1138,37 @@ def system_summary():
 # Dashboard
 # ------------------------------
 
+@lru_cache(maxsize=1)
+def _term_cols(_bucket):
+    """Terminal width, refreshed at most once per second.
+
+    The _bucket argument is int(time.monotonic()) — it exists purely to expire
+    the cache entry, sparing a TIOCGWINSZ ioctl on every dashboard refresh.
+    """
+    return shutil.get_terminal_size((80, 20)).columns
+
+@lru_cache(maxsize=16)
+def _bar_template(width):
+    return "#" * width + "." * width
+
 def make_bar(fraction, width=20):
     """Make a simple [#####.....] bar."""
-    filled = int(round(width * fraction))
-    return "[" + "#" * filled + "." * (width - filled) + "]"
+    # Clamp: psutil.cpu_percent can report slightly over 100, and an
+    # unclamped filled > width would turn the slice below into an empty bar
+    filled = max(0, min(width, int(round(width * fraction))))
+    # One slice of a cached template — snapshot_dashboard calls this once per
+    # core per refresh, so per-call string building adds up on big boxes
+    template = _bar_template(width)
+    return f"[{template[width - filled:2 * width - filled]}]"
 
 
 def snapshot_dashboard():
-    """Return a one-time CPU+RAM usage dashboard string."""
-    cols = shutil.get_terminal_size((80, 20)).columns
+    """Return a one-time CPU+RAM usage dashboard string.
+
+    CPU percentages are measured since the previous call (counters are primed
+    at import), so this never blocks; call it periodically for a rolling view.
+    """
+    cols = _term_cols(int(time.monotonic()))
     bar_width = max(10, min(40, cols // 4))
 
     lines = ["CPU Usage:"]